@@ -17,32 +17,79 @@ Flask メインアプリケーション
 """
 
 import os
-import io
 import json
 import time
+import logging
 from datetime import datetime
 from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
+import orjson
 from werkzeug.utils import secure_filename
-from PIL import Image
 import numpy as np
-import tensorflow as tf
 
 # ユーティリティのインポート
 from utils.image_processor import ImageProcessor
 from utils.model_handler import ModelHandler
+from utils.prediction_cache import PredictionCache
+
+logger = logging.getLogger(__name__)
+
+
+def configure_logging():
+    """
+    ログ出力先の設定（未設定の場合のみ）
+
+    run.py から起動した場合は設定済みのハンドラーをそのまま使用し、
+    gunicorn・python app.py・Vercel などから直接読み込まれた場合は標準出力へ出力する
+    """
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+
+    logging.basicConfig(
+        level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+
+configure_logging()
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    orjson によるJSONプロバイダー
+
+    シリアライズをC実装で行い、レスポンス生成時のPython処理を削減する
+    """
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 # Flaskアプリケーションの初期化
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024  # 10MB制限
 app.config['SECRET_KEY'] = 'beef_marbling_pwa_2025'
 
 # CORS設定（PWAアクセス用）
 CORS(app, origins=['http://localhost:5000', 'https://localhost:5000'])
 
+# レスポンス圧縮（500バイト以上のレスポンスをgzip圧縮）
+Compress(app)
+
 # グローバル変数
 image_processor = None
 model_handler = None
+prediction_cache = None
 
 
 def initialize_components():
@@ -52,15 +99,42 @@ def initialize_components():
     Returns:
         bool: 初期化成功可否
     """
-    global image_processor, model_handler
+    global image_processor, model_handler, prediction_cache
 
     try:
-        # 画像処理器の初期化
-        image_processor = ImageProcessor()
-
-        # モデルハンドラーの初期化
-        model_path = os.path.join('models', 'binary_high_low_model.h5')
-        model_handler = ModelHandler(model_path)
+        # モデルハンドラーの初期化（変換済みの .tflite があれば優先）
+        model_path = os.path.join('models', 'binary_high_low_model.tflite')
+        if not os.path.exists(model_path):
+            model_path = os.path.join('models', 'binary_high_low_model.h5')
+        # Kerasモデルの場合、キャリブレーション画像があれば読み込み時にINT8変換する
+        calibration_dir = os.getenv('CALIBRATION_DIR', os.path.join('data', 'calibration'))
+        if not os.path.isdir(calibration_dir):
+            calibration_dir = None
+        # 前処理済み入力の値域検証（ImageProcessor が値域を保証するため本番では無効化できる）
+        validate_inputs = os.getenv('VALIDATE_INPUTS', 'true').lower() != 'false'
+        # CPU環境でKerasモデルをXLA AOTコンパイルするか（初回起動時のみ時間がかかる）
+        aot_compile = os.getenv('AOT_COMPILE', 'false').lower() == 'true'
+        model_handler = ModelHandler(
+            model_path, calibration_dir=calibration_dir,
+            validate_inputs=validate_inputs, aot_compile=aot_compile)
+
+        # 画像処理器の初期化（モデルの入力データ型に合わせる）
+        image_processor = ImageProcessor(dtype=model_handler.get_input_dtype())
+
+        # 判定結果キャッシュの初期化（撮り直し画像の推論を省略）
+        prediction_cache = PredictionCache(max_size=1024)
+
+        # リクエスト集約器の初期化（同時リクエストを1回のバッチ推論にまとめる）
+        max_batch_size = int(os.getenv('BATCH_MAX_SIZE', '8'))
+        if max_batch_size > 1:
+            model_handler.enable_batching(max_batch_size=max_batch_size)
+
+        # ウォームアップ（コンパイル・エンジン初期化などプロセス内で共有される処理を前倒し）
+        # TFLiteのインタープリターはスレッド毎のため読み込みスレッドでは行わず、
+        # start_serving で推論スレッド上にウォームアップする
+        # （preload 時にフォーク前のマスターでスレッドプールを起動しない）
+        if model_handler.interpreter is None:
+            model_handler.warmup(num_runs=2)
 
         print("✓ 画像処理器とモデルハンドラーの初期化完了")
         return True
@@ -151,45 +225,56 @@ def predict():
                 'message': 'ファイルが選択されていません'
             }), 400
 
-        # ファイル形式チェック
-        allowed_extensions = {'png', 'jpg', 'jpeg'}
-        if '.' not in file.filename or \
-           file.filename.rsplit('.', 1)[1].lower() not in allowed_extensions:
+        # ファイル形式チェック（拡張子ではなく先頭バイトで判定し、デコード前に除外）
+        header = file.stream.read(32)
+        file.stream.seek(0)
+        if image_processor.detect_format(header) is None:
             return jsonify({
                 'status': 'error',
                 'message': 'サポートされていないファイル形式です（PNG, JPG, JPEG のみ）'
             }), 400
 
-        # 画像の読み込みと前処理
-        image = Image.open(io.BytesIO(file.read()))
-        processed_image = image_processor.preprocess(image)
+        # 画像の読み込み
+        image = image_processor.decode(file.read())
 
-        # モデル推論実行
-        prediction_result = model_handler.predict(processed_image)
+        # 知覚ハッシュによるキャッシュ参照（ヒット時は前処理・推論を省略）
+        image_hash = prediction_cache.compute_hash(image)
+        cached_result = prediction_cache.get(image_hash)
+
+        if cached_result is None:
+            # 前処理とモデル推論実行
+            processed_image = image_processor.preprocess(image)
+            prediction_result = model_handler.predict(processed_image)
+            prediction = prediction_result.prediction
+            confidence = prediction_result.confidence
+            prediction_cache.put(image_hash, prediction, confidence)
+        else:
+            prediction = cached_result['prediction']
+            confidence = cached_result['confidence']
 
         # 処理時間計算
         processing_time = round(time.time() - start_time, 2)
 
         # 結果の整形
-        prediction_class = "HIGH" if prediction_result['prediction'] == 1 else "LOW"
+        prediction_class = "HIGH" if prediction == 1 else "LOW"
         classification = "上カルビ" if prediction_class == "HIGH" else "並カルビ"
 
         result = {
             'status': 'success',
             'prediction': prediction_class,
-            'confidence': round(prediction_result['confidence'], 3),
+            'confidence': round(confidence, 3),
             'classification': classification,
             'processing_time': processing_time,
             'timestamp': datetime.now().isoformat()
         }
 
-        print(
-            f"✓ 判定完了: {classification} (信頼度: {result['confidence']:.1%}, 処理時間: {processing_time}s)")
+        logger.info("✓ 判定完了: %s (信頼度: %.1f%%, 処理時間: %ss)",
+                    classification, result['confidence'] * 100, processing_time)
         return jsonify(result)
 
     except Exception as e:
         error_message = f"判定処理中にエラーが発生しました: {str(e)}"
-        print(f"✗ 判定エラー: {error_message}")
+        logger.error("✗ 判定エラー: %s", error_message)
 
         return jsonify({
             'status': 'error',
@@ -207,20 +292,24 @@ def health_check():
     Returns:
         dict: システム状態
     """
-    global model_handler, image_processor
+    global model_handler, image_processor, prediction_cache
 
     status = {
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
         'components': {
             'model_handler': model_handler is not None,
-            'image_processor': image_processor is not None
+            'image_processor': image_processor is not None,
+            'prediction_cache': prediction_cache is not None
         }
     }
 
     if model_handler:
         status['model_info'] = model_handler.get_model_info()
 
+    if prediction_cache:
+        status['cache_stats'] = prediction_cache.get_stats()
+
     return jsonify(status)
 
 
@@ -278,17 +367,36 @@ def not_found(e):
     }), 404
 
 
+def start_serving():
+    """
+    推論スレッドの起動とウォームアップ（ワーカープロセス毎に呼び出す）
+
+    gunicorn では gunicorn.conf.py の post_worker_init から、
+    直接起動時は main から呼び出す
+    """
+    if model_handler is not None:
+        model_handler.start_batching()
+
+
+# モジュール読み込み時に初期化
+# （TFLiteモデル使用時は gunicorn.conf.py の preload_app によりフォーク前に一度だけ実行され、
+#   各ワーカーでモデルを共有する。Kerasモデルは各ワーカーで読み込む）
+initialize_components()
+
+
 def main():
     """
     メイン実行関数
     """
     print("🥩 牛肉マーブリング判定システム PWA版 起動中...")
 
-    # コンポーネント初期化
-    if not initialize_components():
+    # コンポーネント初期化（読み込み時に失敗していた場合は再試行）
+    if model_handler is None and not initialize_components():
         print("✗ 初期化に失敗しました。アプリケーションを終了します。")
         return
 
+    start_serving()
+
     print("✓ 初期化完了")
     print("📱 PWAアクセス: http://localhost:5000")
     print("🔗 API Endpoint: http://localhost:5000/api/predict")
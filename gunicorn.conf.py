@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+牛肉マーブリング判定システム PWA版
+gunicorn 設定ファイル（起動ディレクトリから自動的に読み込まれる）
+
+概要:
+- Procfile・run.py のどちらから起動した場合も共通で適用
+- TFLiteモデル使用時のみ --preload（フォーク前のモデル読み込み）を有効化
+- ワーカープロセス毎の推論スレッド起動・ウォームアップ
+"""
+
+import os
+from importlib.util import find_spec
+
+# 変換済みモデル (.tflite) と軽量ランタイムがある場合のみ、フォーク前に読み込んでワーカー間で共有する
+# （Kerasモデルでは TensorFlow の初期化・XLAコンパイルがマスターで行われ、
+#   TensorFlow のスレッドプールはフォーク後に引き継がれないため、各ワーカーで読み込む）
+preload_app = (
+    os.path.exists(os.path.join('models', 'binary_high_low_model.tflite'))
+    and find_spec('tflite_runtime') is not None
+)
+
+
+def post_worker_init(worker):
+    """
+    ワーカーのアプリケーション読み込み完了後の処理
+
+    --preload の有無にかかわらずフォーク後の各ワーカーで呼び出されるため、
+    推論スレッドをここで起動し、最初のリクエストより前にウォームアップを済ませる
+
+    Args:
+        worker: gunicorn ワーカー
+    """
+    from app import start_serving
+
+    start_serving()
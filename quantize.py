@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+牛肉マーブリング判定システム PWA版
+モデル変換スクリプト（ビルド時実行）
+
+概要:
+- models/binary_high_low_model.h5 を TFLite 形式に変換
+- 推論サーバーは変換後の .tflite を優先して読み込む
+
+使用例:
+    python quantize.py
+    python quantize.py --mode dynamic
+    python quantize.py --mode int8 --calibration-dir data/calibration
+    python quantize.py --mode int8 --sparsity 0.75
+    python quantize.py --input models/binary_high_low_model.h5 --output models/binary_high_low_model.tflite
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+from utils.model_converter import (
+    QUANTIZATION_MODES, build_representative_dataset, convert_model_file,
+    load_calibration_images
+)
+
+project_root = Path(__file__).parent
+
+
+def parse_args():
+    """
+    コマンドライン引数の解析
+
+    Returns:
+        argparse.Namespace: 解析結果
+    """
+    parser = argparse.ArgumentParser(description='Kerasモデルを TFLite 形式に変換します')
+    parser.add_argument(
+        '--input',
+        default=str(project_root / 'models' / 'binary_high_low_model.h5'),
+        help='変換元の Keras モデル (.h5)')
+    parser.add_argument(
+        '--output',
+        default=None,
+        help='出力先 .tflite ファイル（省略時は入力と同じ場所）')
+    parser.add_argument(
+        '--mode',
+        choices=QUANTIZATION_MODES,
+        default='float16',
+        help='量子化モード (float16: FP16重み, dynamic: int8重み/float活性, int8: フル整数)')
+    parser.add_argument(
+        '--calibration-dir',
+        default=str(project_root / 'data' / 'calibration'),
+        help='INT8量子化用のキャリブレーション画像ディレクトリ（切り出し済みの牛肉画像）')
+    parser.add_argument(
+        '--num-calibration-images',
+        type=int,
+        default=100,
+        help='INT8量子化に使用するキャリブレーション画像の枚数')
+    parser.add_argument(
+        '--sparsity',
+        type=float,
+        default=None,
+        help='変換前に重みを枝刈りする目標スパース率（例: 0.75、キャリブレーション画像で再学習）')
+    return parser.parse_args()
+
+
+def main():
+    """
+    メイン実行関数
+    """
+    args = parse_args()
+
+    print(f"📥 変換元モデル: {args.input}")
+    print(f"⚙️ 量子化モード: {args.mode}")
+
+    try:
+        representative_dataset = None
+        if args.mode == 'int8':
+            print(f"🖼️ キャリブレーション画像: {args.calibration_dir}")
+            representative_dataset = build_representative_dataset(
+                args.calibration_dir, args.num_calibration_images)
+
+        pruning_images = None
+        if args.sparsity is not None:
+            print(f"✂️ 枝刈り: 目標スパース率 {args.sparsity:.0%}")
+            pruning_images = load_calibration_images(
+                args.calibration_dir, args.num_calibration_images)
+
+        output_path = convert_model_file(
+            args.input, args.output, args.mode, representative_dataset,
+            pruning_images=pruning_images,
+            target_sparsity=args.sparsity)
+    except Exception as e:
+        print(f"✗ 変換エラー: {e}")
+        return False
+
+    size_mb = output_path.stat().st_size / (1024 * 1024)
+    print(f"✓ 変換完了: {output_path} ({size_mb:.2f} MB)")
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -9,11 +9,18 @@
 - 環境変数による設定
 - ログ設定
 - エラーハンドリング
+
+使用例:
+    python run.py           # アプリケーション起動
+    python run.py --check   # モデルの読み込み・推論確認のみ実行（スモークチェック）
 """
 
 import os
 import sys
+import queue
+import atexit
 import logging
+import logging.handlers
 from pathlib import Path
 
 # プロジェクトルートをPythonパスに追加
@@ -24,35 +31,91 @@ sys.path.insert(0, str(project_root))
 os.environ.setdefault('FLASK_APP', 'app.py')
 os.environ.setdefault('FLASK_ENV', 'development')
 
-# アプリケーションのインポート
-try:
-    from app import app, main
-except ImportError as e:
-    print(f"✗ アプリケーションのインポートに失敗: {e}")
-    print("📋 必要な依存関係をインストールしてください:")
-    print("   pip install -r requirements.txt")
-    sys.exit(1)
+
+def load_application():
+    """
+    アプリケーションのインポート
+
+    インポート時にモデルが読み込まれるため、本番環境（gunicorn起動）では呼び出さない
+
+    Returns:
+        Callable: アプリケーションのメイン実行関数
+    """
+    try:
+        from app import main
+    except ImportError as e:
+        print(f"✗ アプリケーションのインポートに失敗: {e}")
+        print("📋 必要な依存関係をインストールしてください:")
+        print("   pip install -r requirements.txt")
+        sys.exit(1)
+
+    return main
+
+
+def exec_gunicorn(log_listener=None):
+    """
+    本番環境用に gunicorn へプロセスを置き換えて起動
+
+    --preload は gunicorn.conf.py で TFLiteモデル使用時のみ有効化され、
+    モデルはフォーク前に一度だけ読み込まれて各ワーカーはコピーオンライトで共有する
+
+    Args:
+        log_listener (logging.handlers.QueueListener): setup_logging で開始したログ出力スレッド
+    """
+    workers = os.getenv('WEB_CONCURRENCY', str(os.cpu_count() or 1))
+    bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+    # プロセスを置き換えると atexit が実行されないため、キュー内のログと標準出力をここで書き出す
+    if log_listener is not None:
+        log_listener.stop()
+        atexit.unregister(log_listener.stop)
+    sys.stdout.flush()
+
+    os.execvp('gunicorn', [
+        'gunicorn',
+        '-w', workers,
+        '-k', 'gthread',
+        '--threads', '4',
+        '--timeout', '120',
+        '-b', bind,
+        'app:app'
+    ])
 
 
 def setup_logging():
     """
     ログ設定の初期化
+
+    Returns:
+        logging.handlers.QueueListener: ログを出力するバックグラウンドスレッド
     """
     log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
-    logging.basicConfig(
-        level=getattr(logging, log_level),
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('pwa_app.log', encoding='utf-8')
-        ]
-    )
+    formatter = logging.Formatter(log_format)
+    handlers = [
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler('pwa_app.log', encoding='utf-8')
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # リクエストスレッドではキューへの追加のみ行い、出力はバックグラウンドスレッドで実行
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, log_level))
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     # Werkzeugのログレベル調整
     logging.getLogger('werkzeug').setLevel(logging.WARNING)
 
+    return listener
+
 
 def check_dependencies():
     """
@@ -62,7 +125,7 @@ def check_dependencies():
         bool: 依存関係が満たされているか
     """
     required_modules = [
-        'flask', 'flask_cors', 'tensorflow', 'numpy',
+        'flask', 'flask_cors', 'flask_compress', 'orjson', 'numpy',
         'PIL', 'cv2', 'pandas'
     ]
 
@@ -74,6 +137,15 @@ def check_dependencies():
         except ImportError:
             missing_modules.append(module)
 
+    # 推論ランタイム（tflite_runtime または tensorflow のいずれか）
+    try:
+        __import__('tflite_runtime')
+    except ImportError:
+        try:
+            __import__('tensorflow')
+        except ImportError:
+            missing_modules.append('tflite_runtime')
+
     if missing_modules:
         print(f"✗ 不足している依存関係: {', '.join(missing_modules)}")
         print("📋 以下のコマンドで依存関係をインストールしてください:")
@@ -90,7 +162,9 @@ def check_model_files():
     Returns:
         bool: モデルファイルが存在するか
     """
-    model_path = project_root / 'models' / 'binary_high_low_model.h5'
+    model_path = project_root / 'models' / 'binary_high_low_model.tflite'
+    if not model_path.exists():
+        model_path = project_root / 'models' / 'binary_high_low_model.h5'
 
     if not model_path.exists():
         print(f"✗ モデルファイルが見つかりません: {model_path}")
@@ -101,6 +175,33 @@ def check_model_files():
     return True
 
 
+def check_model_loading():
+    """
+    モデルの読み込みと1回の推論を確認（スモークチェック）
+
+    アプリケーションと同じ優先順位（.tflite → .h5）でモデルを選び、
+    ModelHandler の生成とウォームアップ推論が成功するかを確認する
+
+    Returns:
+        bool: 読み込み・推論に成功したか
+    """
+    model_path = project_root / 'models' / 'binary_high_low_model.tflite'
+    if not model_path.exists():
+        model_path = project_root / 'models' / 'binary_high_low_model.h5'
+
+    try:
+        from utils.model_handler import ModelHandler
+
+        model_handler = ModelHandler(model_path)
+        model_handler.warmup(num_runs=1)
+    except Exception as e:
+        print(f"✗ モデル読み込み確認に失敗: {e}")
+        return False
+
+    print(f"✓ モデル読み込み確認完了: {model_path.name} (実行環境: {model_handler.model_info.get('runtime')})")
+    return True
+
+
 def create_directories():
     """
     必要なディレクトリの作成
@@ -138,7 +239,7 @@ def main_startup():
     print_startup_info()
 
     # ログ設定
-    setup_logging()
+    log_listener = setup_logging()
     logger = logging.getLogger(__name__)
 
     try:
@@ -153,10 +254,19 @@ def main_startup():
         if not check_model_files():
             return False
 
+        # スモークチェックのみ実行して終了
+        if '--check' in sys.argv[1:]:
+            return check_model_loading()
+
         logger.info("✓ 全ての事前チェックが完了しました")
 
         # アプリケーション起動
+        if os.getenv('FLASK_ENV') == 'production':
+            logger.info("🚀 gunicorn で本番サーバーを起動します...")
+            exec_gunicorn(log_listener)
+
         logger.info("🚀 PWAアプリケーションを起動します...")
+        main = load_application()
         main()
 
         return True
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+"""
+牛肉マーブリング判定システム PWA版
+テスト共通設定（プロジェクトルートを import パスに追加）
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+牛肉マーブリング判定システム PWA版
+画像デコード (ImageProcessor.decode) のテスト
+"""
+
+import io
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+
+from utils.image_processor import ImageProcessor
+
+
+@pytest.fixture(scope='module')
+def processor() -> ImageProcessor:
+    return ImageProcessor()
+
+
+def _encode_png(image_bgr: np.ndarray) -> bytes:
+    ok, encoded = cv2.imencode('.png', image_bgr)
+    assert ok
+    return encoded.tobytes()
+
+
+def test_rgba_png_is_composited_on_white(processor):
+    # BGRA: 透明・不透明の赤・半透明の赤
+    image = np.zeros((2, 3, 4), dtype=np.uint8)
+    image[:, 0] = (0, 0, 0, 0)
+    image[:, 1] = (0, 0, 255, 255)
+    image[:, 2] = (0, 0, 255, 128)
+
+    decoded = processor.decode(_encode_png(image))
+
+    assert decoded.shape == (2, 3, 3)
+    assert decoded.dtype == np.uint8
+    np.testing.assert_array_equal(decoded[0, 0], (255, 255, 255))
+    np.testing.assert_array_equal(decoded[0, 1], (255, 0, 0))
+    # 255 - 255 * 128 / 255 = 127（G・Bは白背景と半分ずつ合成）
+    np.testing.assert_array_equal(decoded[0, 2], (255, 127, 127))
+
+
+def test_composite_on_white_matches_float_blend():
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, size=(16, 16, 4), dtype=np.uint8)
+
+    alpha = image[..., 3:].astype(np.float64) / 255.0
+    expected = image[..., :3] * alpha + 255.0 * (1.0 - alpha)
+
+    composited = ImageProcessor._composite_on_white(image)
+
+    assert composited.dtype == np.uint8
+    assert np.abs(composited.astype(np.float64) - expected).max() <= 0.5 + 1e-9
+
+
+def test_16bit_png_is_scaled_to_8bit(processor):
+    image = np.zeros((2, 2, 3), dtype=np.uint16)
+    image[0, 0] = (65535, 65535, 65535)
+    image[0, 1] = (0, 0, 65535)  # BGR: 赤
+
+    decoded = processor.decode(_encode_png(image))
+
+    assert decoded.dtype == np.uint8
+    np.testing.assert_array_equal(decoded[0, 0], (255, 255, 255))
+    np.testing.assert_array_equal(decoded[0, 1], (255, 0, 0))
+    np.testing.assert_array_equal(decoded[1, 1], (0, 0, 0))
+
+
+def test_grayscale_png_is_expanded_to_rgb(processor):
+    image = np.full((4, 5), 200, dtype=np.uint8)
+
+    decoded = processor.decode(_encode_png(image))
+
+    assert decoded.shape == (4, 5, 3)
+    assert (decoded == 200).all()
+
+
+def test_jpeg_exif_orientation_is_ignored(processor):
+    # 横長の画像に「90度回転」の EXIF 向き情報を付与
+    image = np.zeros((40, 64, 3), dtype=np.uint8)
+    image[:, :32] = (255, 0, 0)
+    exif = Image.Exif()
+    exif[0x0112] = 6
+
+    buffer = io.BytesIO()
+    Image.fromarray(image).save(buffer, format='JPEG', quality=95, exif=exif)
+
+    decoded = processor.decode(buffer.getvalue())
+
+    # 従来のPILによる読み込みと同様、回転せずに元の向き・色のまま
+    assert decoded.shape == (40, 64, 3)
+    np.testing.assert_allclose(decoded[20, 8], (255, 0, 0), atol=8)
+    np.testing.assert_allclose(decoded[20, 56], (0, 0, 0), atol=8)
+
+
+def test_undecodable_data_raises_value_error(processor):
+    with pytest.raises(ValueError):
+        processor.decode(b'\xff\xd8\xff' + b'\x00' * 32)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+牛肉マーブリング判定システム PWA版
+uint8出力の後処理テーブル (ModelHandler._build_output_lut) のテスト
+
+モデルファイルを読み込まずに、後処理に必要な出力情報のみを設定して検証する
+"""
+
+import numpy as np
+import pytest
+
+# TFLiteランタイム（tflite-runtime または TensorFlow）が無い環境ではスキップ
+ModelHandler = pytest.importorskip('utils.model_handler').ModelHandler
+
+
+def _handler(scale: float, zero_point: int, output_shape=(1, 1)) -> ModelHandler:
+    """uint8出力のTFLiteモデルを読み込んだ状態の ModelHandler を生成"""
+    handler = ModelHandler.__new__(ModelHandler)
+    handler.output_details = [{
+        'shape': np.array(output_shape, dtype=np.int32),
+        'quantization': (scale, zero_point)
+    }]
+    handler.output_dtype = np.dtype(np.uint8)
+    handler._is_binary = output_shape[-1] == 1
+    handler._build_output_lut()
+    return handler
+
+
+@pytest.mark.parametrize('scale, zero_point', [
+    (1.0 / 256.0, 0),
+    (1.0 / 255.0, 0),
+    (1.0 / 200.0, 20),
+])
+def test_lut_matches_float_postprocess(scale, zero_point):
+    handler = _handler(scale, zero_point)
+    assert handler._output_lut is not None
+
+    for level in range(256):
+        output = np.array([level], dtype=np.uint8)
+        prediction, confidence, probabilities = handler._postprocess(output, True)
+
+        # テーブルを使わない場合の後処理（逆量子化して float の確率から判定）
+        prob_high = min(max(float(handler._dequantize_output(output)[0]), 0.0), 1.0)
+        expected_prediction = 1 if prob_high > 0.5 else 0
+
+        assert prediction == expected_prediction
+        assert confidence == pytest.approx(max(prob_high, 1.0 - prob_high), abs=1e-6)
+        assert probabilities == pytest.approx((1.0 - prob_high, prob_high), abs=1e-6)
+
+
+def test_lut_omits_probabilities_unless_requested():
+    handler = _handler(1.0 / 256.0, 0)
+
+    assert handler._postprocess(np.array([200], dtype=np.uint8))[2] is None
+
+
+def test_lut_is_not_built_for_multiclass_output():
+    handler = _handler(1.0 / 256.0, 0, output_shape=(1, 3))
+
+    assert handler._output_lut is None
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+牛肉マーブリング判定システム PWA版
+判定結果キャッシュ (PredictionCache) のテスト
+"""
+
+import numpy as np
+from PIL import Image
+
+from utils.prediction_cache import PredictionCache
+
+
+def _sample_image(seed: int = 0) -> np.ndarray:
+    """滑らかな模様のRGB画像を生成（乱数のみの画像はpHashの比較に向かないため）"""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:96, 0:128].astype(np.float32)
+    phases = rng.uniform(0, 2 * np.pi, size=3)
+    channels = [127 + 100 * np.sin(x / (10 + 5 * i) + y / 17 + phase)
+                for i, phase in enumerate(phases)]
+    return np.clip(np.stack(channels, axis=-1), 0, 255).astype(np.uint8)
+
+
+def _hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PredictionCache(max_size=2)
+    cache.put(1, prediction=0, confidence=0.9)
+    cache.put(2, prediction=1, confidence=0.8)
+
+    # 1 を参照して最近使用に移動し、2 が最も古くなる
+    assert cache.get(1) == {'prediction': 0, 'confidence': 0.9}
+    cache.put(3, prediction=1, confidence=0.7)
+
+    assert cache.get(2) is None
+    assert cache.get(1) is not None
+    assert cache.get(3) == {'prediction': 1, 'confidence': 0.7}
+    assert cache.get_stats() == {
+        'size': 2, 'max_size': 2, 'hits': 3, 'misses': 1, 'hit_rate': 0.75
+    }
+
+
+def test_put_existing_hash_updates_without_growing():
+    cache = PredictionCache(max_size=2)
+    cache.put(1, prediction=0, confidence=0.6)
+    cache.put(1, prediction=1, confidence=0.9)
+
+    assert cache.get(1) == {'prediction': 1, 'confidence': 0.9}
+    assert cache.get_stats()['size'] == 1
+
+
+def test_clear_resets_entries_and_stats():
+    cache = PredictionCache(max_size=2)
+    cache.put(1, prediction=0, confidence=0.6)
+    cache.get(1)
+    cache.get(2)
+    cache.clear()
+
+    assert cache.get_stats() == {
+        'size': 0, 'max_size': 2, 'hits': 0, 'misses': 0, 'hit_rate': 0.0
+    }
+
+
+def test_hash_is_stable_64bit_integer():
+    image = _sample_image()
+    image_hash = PredictionCache.compute_hash(image)
+
+    assert isinstance(image_hash, int)
+    assert 0 <= image_hash < 1 << 64
+    assert PredictionCache.compute_hash(image.copy()) == image_hash
+    assert PredictionCache.compute_hash(image) == image_hash
+
+
+def test_hash_accepts_pil_rgba_and_grayscale_inputs():
+    image = _sample_image()
+    image_hash = PredictionCache.compute_hash(image)
+
+    rgba = np.dstack([image, np.full(image.shape[:2], 255, np.uint8)])
+    gray = np.asarray(Image.fromarray(image).convert('L'))
+
+    assert PredictionCache.compute_hash(rgba) == image_hash
+    # PIL と OpenCV のグレースケール変換は丸めが異なるため、ほぼ一致することを確認
+    assert _hamming(PredictionCache.compute_hash(Image.fromarray(image)), image_hash) <= 2
+    assert _hamming(PredictionCache.compute_hash(gray), image_hash) <= 2
+
+
+def test_hash_tolerates_small_changes_and_separates_different_images():
+    image = _sample_image()
+    image_hash = PredictionCache.compute_hash(image)
+
+    noise = np.random.default_rng(1).integers(-3, 4, size=image.shape)
+    noisy = np.clip(image.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+    assert _hamming(PredictionCache.compute_hash(noisy), image_hash) <= 4
+    assert _hamming(PredictionCache.compute_hash(_sample_image(seed=5)), image_hash) > 10
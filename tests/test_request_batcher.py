@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+牛肉マーブリング判定システム PWA版
+推論リクエスト集約 (RequestBatcher) のテスト
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from utils.request_batcher import RequestBatcher
+
+
+def _image(value: float) -> np.ndarray:
+    """値 value で埋めた 1 画像分の入力を生成"""
+    return np.full((1, 4, 4, 3), value, dtype=np.float32)
+
+
+def _submit_in_threads(batcher: RequestBatcher, values) -> tuple:
+    """
+    各値の画像を別スレッドから投入する
+
+    Returns:
+        tuple: (スレッドのリスト, 値→結果の辞書, 値→例外の辞書)
+    """
+    results = {}
+    errors = {}
+
+    def worker(value):
+        try:
+            results[value] = batcher.submit(_image(value))
+        except Exception as e:
+            errors[value] = e
+
+    threads = [threading.Thread(target=worker, args=(value,)) for value in values]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def _wait_for_queue(batcher: RequestBatcher, size: int, timeout: float = 5.0) -> None:
+    """キューに size 件のリクエストが溜まるまで待機"""
+    deadline = time.monotonic() + timeout
+    while batcher._queue.qsize() < size:
+        assert time.monotonic() < deadline, "リクエストがキューに到着しません"
+        time.sleep(0.001)
+
+
+class _GatedPredictor:
+    """
+    最初のバッチで gate が開くまで停止するバッチ推論関数
+
+    停止中に後続のリクエストをキューへ溜め、次のバッチの集約を確定的に確認する
+    """
+
+    def __init__(self, error: Exception = None):
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.batch_sizes = []
+        self.error = error
+
+    def __call__(self, images: np.ndarray) -> list:
+        self.batch_sizes.append(len(images))
+        if len(self.batch_sizes) == 1:
+            self.started.set()
+            self.gate.wait(5.0)
+        elif self.error is not None:
+            raise self.error
+        return [float(image[0, 0, 0]) for image in images]
+
+
+def test_results_are_returned_to_each_caller():
+    predictor = _GatedPredictor()
+    batcher = RequestBatcher(predictor, max_batch_size=4, max_latency_ms=50.0)
+
+    first, first_results, _ = _submit_in_threads(batcher, [0.0])
+    assert predictor.started.wait(5.0)
+
+    values = [0.1, 0.2, 0.3, 0.4]
+    threads, results, errors = _submit_in_threads(batcher, values)
+    _wait_for_queue(batcher, len(values))
+    predictor.gate.set()
+
+    for thread in first + threads:
+        thread.join(5.0)
+
+    assert not errors
+    assert first_results == {0.0: 0.0}
+    assert results == {value: pytest.approx(value) for value in values}
+
+
+def test_queued_requests_are_collected_into_one_batch():
+    predictor = _GatedPredictor()
+    batcher = RequestBatcher(predictor, max_batch_size=3, max_latency_ms=50.0)
+
+    first, _, _ = _submit_in_threads(batcher, [0.0])
+    assert predictor.started.wait(5.0)
+
+    # 最大バッチサイズを超えた分は次のバッチに回る
+    threads, results, _ = _submit_in_threads(batcher, [0.1, 0.2, 0.3, 0.4])
+    _wait_for_queue(batcher, 4)
+    predictor.gate.set()
+
+    for thread in first + threads:
+        thread.join(5.0)
+
+    assert predictor.batch_sizes == [1, 3, 1]
+    assert len(results) == 4
+    assert batcher.get_stats() == {
+        'batch_count': 3,
+        'request_count': 5,
+        'average_batch_size': round(5 / 3, 2),
+        'max_batch_size': 3
+    }
+
+
+def test_single_request_does_not_wait_for_max_latency():
+    batcher = RequestBatcher(
+        lambda images: [0] * len(images),
+        max_batch_size=8, max_latency_ms=2000.0, idle_timeout_ms=1.0)
+
+    start = time.monotonic()
+    assert batcher.submit(_image(0.5)) == 0
+
+    # 後続が無ければ idle_timeout で打ち切り、max_latency まで待たない
+    assert time.monotonic() - start < 1.0
+    assert batcher.get_stats()['batch_count'] == 1
+
+
+def test_error_is_raised_in_every_caller_of_the_batch():
+    predictor = _GatedPredictor(error=ValueError("推論失敗"))
+    batcher = RequestBatcher(predictor, max_batch_size=4, max_latency_ms=50.0)
+
+    first, first_results, _ = _submit_in_threads(batcher, [0.0])
+    assert predictor.started.wait(5.0)
+
+    values = [0.1, 0.2, 0.3]
+    threads, results, errors = _submit_in_threads(batcher, values)
+    _wait_for_queue(batcher, len(values))
+    predictor.gate.set()
+
+    for thread in first + threads:
+        thread.join(5.0)
+
+    assert first_results == {0.0: 0.0}
+    assert not results
+    assert set(errors) == set(values)
+    for error in errors.values():
+        assert isinstance(error, RuntimeError)
+        assert "推論失敗" in str(error)
+
+    # エラー後も推論スレッドは継続する
+    predictor.error = None
+    assert batcher.submit(_image(0.7)) == pytest.approx(0.7)
+
+
+def test_warmup_runs_on_worker_thread_before_requests():
+    calls = []
+    batcher = RequestBatcher(
+        lambda images: [0] * len(images),
+        warmup_fn=lambda: calls.append(threading.current_thread().name))
+
+    batcher.start()
+    batcher.submit(_image(0.0))
+
+    assert calls == ['request-batcher']
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+牛肉マーブリング判定システム PWA版
+XLA AOTコンパイルモジュール（CPU環境用）
+
+概要:
+- 入力形状固定のKerasモデルを XLA で事前コンパイルし、共有ライブラリ (.so) を生成
+- 推論時は TensorFlow のグラフ実行を介さず、生成された関数を ctypes で直接呼び出す
+- コンパイラ・ヘッダーが無い環境では使用しない（呼び出し側でフォールバック）
+
+主な機能:
+- Keras → SavedModel（入力形状固定のシグネチャ）
+- saved_model_cli aot_compile_cpu によるオブジェクト生成（実行環境のアーキテクチャ向け）
+- C呼び出し用ラッパーと XLA AOT ランタイムのビルド、ctypes による推論実行
+"""
+
+import os
+import ctypes
+import shutil
+import platform
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Tuple, Union
+
+import numpy as np
+
+# 生成するC++クラス名とC関数名
+AOT_CLASS_NAME = 'MarblingPredictor'
+AOT_FUNCTION_NAME = 'marbling_run'
+
+# 生成クラスをC関数として公開するラッパー
+# （スレッド毎にインスタンスを持ち、入力は呼び出し側のバッファを直接参照する）
+_WRAPPER_SOURCE = """
+#include <cstring>
+#include "marbling.h"
+
+extern "C" int {function}(const void* input, void* output, size_t output_bytes) {{
+  thread_local {cls} predictor(
+      {cls}::AllocMode::RESULTS_PROFILES_AND_TEMPS_ONLY);
+  predictor.set_arg_data(0, input);
+  if (!predictor.Run()) {{
+    return 1;
+  }}
+  std::memcpy(output, predictor.result_data(0), output_bytes);
+  return 0;
+}}
+"""
+
+
+def compile_aot_library(model, input_shape: Tuple[int, ...],
+                        library_path: Union[str, Path]) -> Path:
+    """
+    KerasモデルをXLAで事前コンパイルし、共有ライブラリとして保存
+
+    作業ディレクトリでビルドしたライブラリを読み込んで1回推論し、Kerasモデルと
+    出力が一致することを確認してから出力先へ配置する（不完全なライブラリはキャッシュしない）
+
+    Args:
+        model (tf.keras.Model): 変換対象のKerasモデル
+        input_shape (Tuple[int, ...]): 入力形状 (1, height, width, 3)
+        library_path (Union[str, Path]): 出力先 (.so)
+
+    Returns:
+        Path: 出力した共有ライブラリのパス
+
+    Raises:
+        RuntimeError: saved_model_cli・コンパイラ・AOTランタイムのソースが見つからない、
+            ビルドに失敗した、または出力が一致しない場合
+    """
+    import tensorflow as tf
+
+    saved_model_cli = shutil.which('saved_model_cli')
+    compiler = shutil.which('g++') or shutil.which('c++')
+    if saved_model_cli is None or compiler is None:
+        raise RuntimeError("saved_model_cli と C++ コンパイラが必要です")
+
+    # 生成コードが参照する XLA AOT ランタイム（pip パッケージにソースとして同梱）
+    runtime_dir = Path(tf.__file__).parent / 'xla_aot_runtime_src'
+    runtime_sources = sorted(
+        str(path) for path in runtime_dir.rglob('*.cc') if not path.name.endswith('_test.cc'))
+    if not runtime_sources:
+        raise RuntimeError(f"XLA AOTランタイムのソースが見つかりません: {runtime_dir}")
+
+    library_path = Path(library_path)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        work_dir = Path(work_dir)
+
+        # 入力形状を固定したシグネチャで SavedModel を出力
+        spec = tf.TensorSpec(input_shape, tf.float32, name='input')
+        serving_fn = tf.function(lambda x: model(x, training=False)).get_concrete_function(spec)
+        tf.saved_model.save(model, str(work_dir / 'saved_model'),
+                            signatures={'serving_default': serving_fn})
+
+        # XLA によるオブジェクトファイル (marbling.o) とヘッダー (marbling.h) の生成
+        _run([
+            saved_model_cli, 'aot_compile_cpu',
+            '--dir', str(work_dir / 'saved_model'),
+            '--tag_set', 'serve',
+            '--signature_def_key', 'serving_default',
+            '--output_prefix', str(work_dir / 'marbling'),
+            '--cpp_class', AOT_CLASS_NAME,
+            '--target_triple', _host_target_triple()
+        ])
+
+        wrapper_path = work_dir / 'wrapper.cc'
+        wrapper_path.write_text(
+            _WRAPPER_SOURCE.format(function=AOT_FUNCTION_NAME, cls=AOT_CLASS_NAME))
+
+        built_path = work_dir / 'marbling.so'
+        _run([
+            compiler, '-shared', '-fPIC', '-O2', '-std=c++17',
+            f'-I{work_dir}', f'-I{runtime_dir}', *tf.sysconfig.get_compile_flags(),
+            str(wrapper_path), str(work_dir / 'marbling.o'), *runtime_sources,
+            '-o', str(built_path),
+            *tf.sysconfig.get_link_flags(), '-lpthread'
+        ])
+
+        # 読み込み・推論できることを確認（未解決シンボルがあればここで失敗する）
+        sample = np.random.default_rng(0).random(input_shape, dtype=np.float32)
+        expected = model(sample, training=False).numpy().astype(np.float32)
+        output = AOTModel(built_path, expected.shape).infer(sample)
+        if not np.allclose(output, expected, atol=1e-3):
+            raise RuntimeError(
+                f"AOTコンパイル結果がKerasモデルと一致しません (最大差: {np.abs(output - expected).max():.6f})")
+
+        # 同じ出力先へ複数プロセスが同時に書き込んでも不完全なファイルを読まないよう、
+        # 出力先ディレクトリの一時ファイルへ複製してから置き換える
+        fd, temp_path = tempfile.mkstemp(suffix='.so', dir=library_path.parent)
+        os.close(fd)
+        try:
+            shutil.copyfile(built_path, temp_path)
+            os.replace(temp_path, library_path)
+        except OSError:
+            os.unlink(temp_path)
+            raise
+
+    return library_path
+
+
+def _host_target_triple() -> str:
+    """
+    実行環境のアーキテクチャに対応する LLVM ターゲットトリプルを取得
+
+    Returns:
+        str: ターゲットトリプル（例: 'x86_64-unknown-linux-gnu', 'aarch64-unknown-linux-gnu'）
+    """
+    machine = platform.machine().lower()
+    arch = {'amd64': 'x86_64', 'arm64': 'aarch64'}.get(machine, machine)
+
+    if platform.system() == 'Darwin':
+        return f"{'arm64' if arch == 'aarch64' else arch}-apple-darwin"
+    return f"{arch}-unknown-linux-gnu"
+
+
+def _run(command: list) -> None:
+    """
+    外部コマンドを実行
+
+    Args:
+        command (list): 実行するコマンドと引数
+
+    Raises:
+        RuntimeError: コマンドが失敗した場合
+    """
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"{Path(command[0]).name} の実行に失敗しました: {result.stderr.strip()[-500:]}")
+
+
+class AOTModel:
+    """
+    AOTコンパイル済みモデルクラス
+
+    固定形状 (1, height, width, 3) の float32 入力に対して推論する
+    """
+
+    def __init__(self, library_path: Union[str, Path], output_shape: Tuple[int, ...]):
+        """
+        共有ライブラリの読み込み
+
+        Args:
+            library_path (Union[str, Path]): AOTコンパイル済みライブラリ (.so) のパス
+            output_shape (Tuple[int, ...]): 出力形状 (1, num_outputs)
+
+        Raises:
+            OSError: ライブラリを読み込めない場合
+        """
+        self.library_path = Path(library_path)
+        self.output_shape = tuple(output_shape)
+
+        self._library = ctypes.CDLL(str(self.library_path))
+        self._run = getattr(self._library, AOT_FUNCTION_NAME)
+        self._run.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+        self._run.restype = ctypes.c_int
+
+    def infer(self, image_array: np.ndarray) -> np.ndarray:
+        """
+        推論を実行
+
+        Args:
+            image_array (np.ndarray): 入力画像 (1, height, width, 3)、float32
+
+        Returns:
+            np.ndarray: モデル出力
+
+        Raises:
+            RuntimeError: 推論に失敗した場合
+        """
+        image_array = np.ascontiguousarray(image_array, dtype=np.float32)
+        output = np.empty(self.output_shape, dtype=np.float32)
+
+        if self._run(image_array.ctypes.data, output.ctypes.data, output.nbytes) != 0:
+            raise RuntimeError("AOTコンパイル済みモデルの推論に失敗しました")
+
+        return output
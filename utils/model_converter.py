@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""
+牛肉マーブリング判定システム PWA版
+モデル変換モジュール
+
+概要:
+- Keras (.h5) モデルを TensorFlow Lite FlatBuffer (.tflite) に変換
+- FP16 / ダイナミックレンジ / フル整数(INT8)量子化に対応
+- 変換はビルド時に一度だけ実行し、推論時は .tflite を読み込む
+
+主な機能:
+- Kerasモデルの読み込み
+- TFLiteConverter による量子化変換
+- INT8量子化用の代表データセット（キャリブレーション画像）生成
+- 重みの枝刈り（tensorflow-model-optimization、量子化と併用可能）
+- 変換結果のファイル出力
+"""
+
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from .image_processor import ImageProcessor
+
+# 量子化モード
+QUANTIZATION_MODES = ('float16', 'dynamic', 'int8')
+
+# キャリブレーション画像として扱う拡張子
+CALIBRATION_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
+
+
+def _list_calibration_images(calibration_dir: Union[str, Path], num_images: int) -> List[Path]:
+    """
+    キャリブレーション画像のパス一覧を取得
+
+    Args:
+        calibration_dir (Union[str, Path]): キャリブレーション画像のディレクトリ
+        num_images (int): 使用する画像の最大枚数
+
+    Returns:
+        List[Path]: 画像パス（名前順）
+
+    Raises:
+        FileNotFoundError: キャリブレーション画像が見つからない場合
+    """
+    calibration_dir = Path(calibration_dir)
+    image_paths = sorted(
+        path for path in calibration_dir.rglob('*')
+        if path.suffix.lower() in CALIBRATION_EXTENSIONS
+    )[:num_images]
+
+    if not image_paths:
+        raise FileNotFoundError(f"キャリブレーション画像が見つかりません: {calibration_dir}")
+
+    return image_paths
+
+
+def load_calibration_images(calibration_dir: Union[str, Path],
+                            num_images: int = 100,
+                            image_processor: Optional[ImageProcessor] = None) -> np.ndarray:
+    """
+    キャリブレーション画像を前処理済みのバッチとして読み込み
+
+    Args:
+        calibration_dir (Union[str, Path]): キャリブレーション画像のディレクトリ
+        num_images (int): 使用する画像の最大枚数
+        image_processor (Optional[ImageProcessor]): 前処理に使用する画像処理器
+
+    Returns:
+        np.ndarray: (num_images, height, width, 3) の float32 配列
+
+    Raises:
+        FileNotFoundError: キャリブレーション画像が見つからない場合
+    """
+    image_paths = _list_calibration_images(calibration_dir, num_images)
+    processor = image_processor or ImageProcessor()
+
+    # preprocess の戻り値は再利用バッファのため、画像毎に確保済み配列へ書き込む
+    images = np.empty((len(image_paths),) + processor.input_shape, dtype=np.float32)
+    for i, path in enumerate(image_paths):
+        images[i] = processor.preprocess(processor.decode(path.read_bytes()))[0]
+    return images
+
+
+def build_representative_dataset(calibration_dir: Union[str, Path],
+                                 num_images: int = 100,
+                                 image_processor: Optional[ImageProcessor] = None
+                                 ) -> Callable[[], Iterator[List[np.ndarray]]]:
+    """
+    INT8量子化用の代表データセット生成関数を作成
+
+    Args:
+        calibration_dir (Union[str, Path]): キャリブレーション画像のディレクトリ
+        num_images (int): 使用する画像の最大枚数
+        image_processor (Optional[ImageProcessor]): 前処理に使用する画像処理器
+
+    Returns:
+        Callable[[], Iterator[List[np.ndarray]]]: (1, height, width, 3) の float32 テンソルを返すジェネレーター関数
+
+    Raises:
+        FileNotFoundError: キャリブレーション画像が見つからない場合
+    """
+    image_paths = _list_calibration_images(calibration_dir, num_images)
+    processor = image_processor or ImageProcessor()
+
+    def representative_data_gen():
+        # 入力の量子化範囲を [0, 1] に固定するため黒・白画像を含める
+        # （scale=1/255, zero_point=0 となり uint8 画素値をそのまま入力できる）
+        for value in (0.0, 1.0):
+            yield [np.full((1,) + processor.input_shape, value, dtype=np.float32)]
+
+        for path in image_paths:
+            image = processor.decode(path.read_bytes())
+            # preprocess の戻り値は再利用バッファのためコピーする
+            yield [processor.preprocess(image).copy()]
+
+    return representative_data_gen
+
+
+def prune_keras_model(model, images: np.ndarray, target_sparsity: float = 0.75,
+                      epochs: int = 2, batch_size: int = 16):
+    """
+    Kerasモデルの重みを枝刈り（振幅の小さい重みを0にする）し、短時間の再学習で精度を回復
+
+    キャリブレーション画像には正解ラベルが無いため、枝刈り前のモデルの出力を
+    教師とする自己蒸留で再学習する
+
+    Args:
+        model (tf.keras.Model): 枝刈り対象のKerasモデル
+        images (np.ndarray): 再学習に使用する前処理済み画像 (num_images, height, width, 3)
+        target_sparsity (float): 目標スパース率（0の重みの割合、0.0-1.0）
+        epochs (int): 再学習のエポック数
+        batch_size (int): 再学習のバッチサイズ
+
+    Returns:
+        tf.keras.Model: 枝刈り用ラッパーを除去した通常のKerasモデル
+
+    Raises:
+        ValueError: 目標スパース率が範囲外の場合
+    """
+    import tensorflow as tf
+    import tensorflow_model_optimization as tfmot
+
+    if not 0.0 < target_sparsity < 1.0:
+        raise ValueError(f"目標スパース率は 0.0 より大きく 1.0 未満で指定してください: {target_sparsity}")
+
+    # 枝刈り前のモデルの出力を教師信号として使用
+    targets = model.predict(images, batch_size=batch_size, verbose=0)
+
+    steps_per_epoch = -(-len(images) // batch_size)
+    pruning_schedule = tfmot.sparsity.keras.ConstantSparsity(
+        target_sparsity, begin_step=0, frequency=max(1, steps_per_epoch // 2))
+    pruned_model = tfmot.sparsity.keras.prune_low_magnitude(
+        model, pruning_schedule=pruning_schedule)
+
+    loss = 'binary_crossentropy' if targets.shape[-1] == 1 else 'categorical_crossentropy'
+    pruned_model.compile(optimizer=tf.keras.optimizers.Adam(1e-5), loss=loss)
+    pruned_model.fit(
+        images, targets, batch_size=batch_size, epochs=epochs, verbose=0,
+        callbacks=[tfmot.sparsity.keras.UpdatePruningStep()])
+
+    return tfmot.sparsity.keras.strip_pruning(pruned_model)
+
+
+def compute_sparsity(model) -> float:
+    """
+    Kerasモデルの重みのスパース率（0の重みの割合）を計算
+
+    Args:
+        model (tf.keras.Model): 対象のKerasモデル
+
+    Returns:
+        float: スパース率（0.0-1.0）
+    """
+    total = 0
+    zeros = 0
+    for weight in model.weights:
+        values = weight.numpy()
+        total += values.size
+        zeros += values.size - np.count_nonzero(values)
+    return zeros / max(total, 1)
+
+
+def convert_keras_to_tflite(model, quantization: str = 'float16',
+                            representative_dataset: Optional[Callable] = None) -> bytes:
+    """
+    KerasモデルをTFLite FlatBufferに変換
+
+    Args:
+        model (tf.keras.Model): 変換対象のKerasモデル
+        quantization (str): 量子化モード
+            'float16': 重みをFP16で保持（精度はほぼ変化なし）
+            'dynamic': ダイナミックレンジ量子化（int8重み / float活性）
+            'int8': フル整数量子化（int8重み・活性、uint8入出力）
+        representative_dataset (Optional[Callable]): INT8量子化用の代表データセット
+
+    Returns:
+        bytes: TFLite FlatBuffer
+
+    Raises:
+        ValueError: 未対応の量子化モード、または代表データセットが未指定の場合
+    """
+    import tensorflow as tf
+
+    if quantization not in QUANTIZATION_MODES:
+        raise ValueError(
+            f"未対応の量子化モード: {quantization} (対応: {', '.join(QUANTIZATION_MODES)})")
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+
+    if quantization == 'float16':
+        converter.target_spec.supported_types = [tf.float16]
+
+    elif quantization == 'int8':
+        if representative_dataset is None:
+            raise ValueError("INT8量子化には代表データセットが必要です")
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.uint8
+        converter.inference_output_type = tf.uint8
+
+    return converter.convert()
+
+
+def convert_model_file(model_path: Union[str, Path],
+                       output_path: Union[str, Path, None] = None,
+                       quantization: str = 'float16',
+                       representative_dataset: Optional[Callable] = None,
+                       pruning_images: Optional[np.ndarray] = None,
+                       target_sparsity: float = 0.75) -> Path:
+    """
+    Kerasモデルファイルを読み込み、.tflite ファイルとして保存
+
+    Args:
+        model_path (Union[str, Path]): Kerasモデルファイルのパス
+        output_path (Union[str, Path, None]): 出力先（省略時は拡張子を .tflite に置換）
+        quantization (str): 量子化モード
+        representative_dataset (Optional[Callable]): INT8量子化用の代表データセット
+        pruning_images (Optional[np.ndarray]): 枝刈り後の再学習に使用する画像（指定時のみ枝刈り）
+        target_sparsity (float): 枝刈りの目標スパース率
+
+    Returns:
+        Path: 出力した .tflite ファイルのパス
+
+    Raises:
+        FileNotFoundError: モデルファイルが見つからない場合
+    """
+    import tensorflow as tf
+
+    model_path = Path(model_path)
+    if not model_path.exists():
+        raise FileNotFoundError(f"モデルファイルが見つかりません: {model_path}")
+
+    output_path = Path(output_path) if output_path else model_path.with_suffix('.tflite')
+
+    model = tf.keras.models.load_model(str(model_path))
+    if pruning_images is not None:
+        model = prune_keras_model(model, pruning_images, target_sparsity)
+    tflite_model = convert_keras_to_tflite(model, quantization, representative_dataset)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(tflite_model)
+
+    return output_path
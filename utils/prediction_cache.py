@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+牛肉マーブリング判定システム PWA版
+判定結果キャッシュモジュール
+
+概要:
+- 画像の知覚ハッシュ (pHash) をキーに判定結果を保持
+- 同一部位の撮り直し時に前処理・推論を省略
+- LRU方式で件数上限を管理
+
+主な機能:
+- 64bit pHash の計算（32x32 DCT の低周波 8x8 を中央値で2値化）
+- スレッドセーフな LRU キャッシュ
+- ヒット率等の統計情報の提供
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Union
+
+import cv2
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionCache:
+    """
+    判定結果キャッシュクラス
+
+    知覚ハッシュが一致する画像の判定結果を再利用する
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        キャッシュの初期化
+
+        Args:
+            max_size (int): 保持する判定結果の最大件数
+        """
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        logger.info("✓ 判定結果キャッシュ初期化完了 - 最大件数: %d", max_size)
+
+    @staticmethod
+    def compute_hash(image: Union[Image.Image, np.ndarray]) -> int:
+        """
+        画像の64bit知覚ハッシュ (pHash) を計算
+
+        Args:
+            image (Union[Image.Image, np.ndarray]): デコード済み画像（RGB/RGBA/グレースケール）
+
+        Returns:
+            int: 64bitハッシュ値
+        """
+        if isinstance(image, Image.Image):
+            gray = np.asarray(image.convert('L'))
+        elif image.ndim == 2:
+            gray = image
+        elif image.shape[2] == 4:
+            gray = cv2.cvtColor(image, cv2.COLOR_RGBA2GRAY)
+        else:
+            gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+
+        small = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA)
+        dct = cv2.dct(small.astype(np.float32))
+
+        # 低周波成分 8x8 を中央値（直流成分を除く）で2値化
+        low_freq = dct[:8, :8].ravel()
+        bits = low_freq > np.median(low_freq[1:])
+
+        return int(np.packbits(bits).view('>u8')[0])
+
+    def get(self, image_hash: int) -> Optional[Dict[str, Union[int, float]]]:
+        """
+        キャッシュ済みの判定結果を取得
+
+        Args:
+            image_hash (int): 画像の知覚ハッシュ
+
+        Returns:
+            Optional[Dict[str, Union[int, float]]]: 判定結果（未登録の場合はNone）
+                {
+                    'prediction': int,
+                    'confidence': float
+                }
+        """
+        with self._lock:
+            result = self._entries.get(image_hash)
+            if result is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(image_hash)
+            self.hits += 1
+            return result
+
+    def put(self, image_hash: int, prediction: int, confidence: float) -> None:
+        """
+        判定結果を登録
+
+        Args:
+            image_hash (int): 画像の知覚ハッシュ
+            prediction (int): 判定クラス
+            confidence (float): 信頼度
+        """
+        with self._lock:
+            self._entries[image_hash] = {
+                'prediction': prediction,
+                'confidence': confidence
+            }
+            self._entries.move_to_end(image_hash)
+
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        キャッシュと統計情報をクリア
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        キャッシュ統計を取得
+
+        Returns:
+            Dict[str, Union[int, float]]: キャッシュ統計
+        """
+        total = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / max(total, 1), 4)
+        }
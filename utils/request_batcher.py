@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+牛肉マーブリング判定システム PWA版
+推論リクエスト集約モジュール
+
+概要:
+- 同時に到着した判定リクエストを1回のバッチ推論にまとめる
+- 推論1回あたりの固定オーバーヘッドを複数画像で分担
+- 待機リクエストが無い場合は即座に単独で推論
+
+主な機能:
+- リクエストキューと専用の推論スレッド
+- バッチサイズ・待機時間による集約制御
+- リクエスト毎の結果受け渡し
+"""
+
+import os
+import time
+import queue
+import logging
+import threading
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingRequest:
+    """
+    推論待ちリクエスト
+    """
+
+    __slots__ = ('image_array', 'event', 'result', 'error')
+
+    def __init__(self, image_array: np.ndarray):
+        self.image_array = image_array
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class RequestBatcher:
+    """
+    推論リクエスト集約クラス
+
+    predict_batch 関数を専用スレッドから呼び出し、同時リクエストをまとめて推論する
+    """
+
+    def __init__(self, predict_batch_fn: Callable[[np.ndarray], List[Any]],
+                 max_batch_size: int = 8, max_latency_ms: float = 5.0,
+                 idle_timeout_ms: float = 1.0,
+                 warmup_fn: Optional[Callable[[], Any]] = None):
+        """
+        リクエスト集約器の初期化
+
+        Args:
+            predict_batch_fn (Callable[[np.ndarray], List[Any]]): バッチ推論関数
+            max_batch_size (int): 1回の推論にまとめる最大画像数
+            max_latency_ms (float): 最初のリクエストからの最大待機時間（ミリ秒）
+            idle_timeout_ms (float): 後続リクエストが無い場合に単独推論へ切り替える待機時間（ミリ秒）
+            warmup_fn (Optional[Callable[[], Any]]): 推論スレッド起動時に同スレッド上で実行するウォームアップ関数
+        """
+        self.predict_batch_fn = predict_batch_fn
+        self.warmup_fn = warmup_fn
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000.0
+        self.idle_timeout = idle_timeout_ms / 1000.0
+        self.batch_count = 0
+        self.request_count = 0
+
+        self._queue = None
+        self._worker = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+
+        logger.info("✓ リクエスト集約器初期化完了 - 最大バッチ: %d, 待機: %sms",
+                    max_batch_size, max_latency_ms)
+
+    def submit(self, image_array: np.ndarray) -> Any:
+        """
+        1画像の推論を依頼し、結果を待機
+
+        Args:
+            image_array (np.ndarray): 前処理済み画像 (1, height, width, 3)
+
+        Returns:
+            Any: predict_batch_fn が返した当該画像の結果
+
+        Raises:
+            RuntimeError: 推論中にエラーが発生した場合
+        """
+        self._ensure_worker()
+
+        request = _PendingRequest(image_array)
+        self._queue.put(request)
+        request.event.wait()
+
+        if request.error is not None:
+            raise RuntimeError(str(request.error))
+
+        return request.result
+
+    def start(self) -> None:
+        """
+        推論スレッドを起動（ワーカープロセスの準備完了時に呼び出す）
+
+        初回リクエストを待たずに起動し、ウォームアップを推論スレッド上で済ませる
+        """
+        self._ensure_worker()
+
+    def _ensure_worker(self) -> None:
+        """
+        推論スレッドの起動確認
+
+        gunicorn --preload ではフォーク前のスレッドが引き継がれないため、
+        プロセス毎に初回呼び出し時に起動する
+        """
+        if self._pid == os.getpid():
+            return
+
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+
+            self._queue = queue.Queue()
+            self._worker = threading.Thread(
+                target=self._run, args=(self._queue,),
+                name='request-batcher', daemon=True)
+            self._worker.start()
+            self._pid = os.getpid()
+
+    def _collect(self, request_queue: queue.Queue) -> List[_PendingRequest]:
+        """
+        キューからバッチ分のリクエストを取り出す
+
+        Args:
+            request_queue (queue.Queue): リクエストキュー
+
+        Returns:
+            List[_PendingRequest]: まとめて推論するリクエスト
+        """
+        batch = [request_queue.get()]
+        deadline = time.monotonic() + self.max_latency
+
+        while len(batch) < self.max_batch_size:
+            # 既に到着しているリクエストは待たずに取り込む
+            try:
+                batch.append(request_queue.get_nowait())
+                continue
+            except queue.Empty:
+                pass
+
+            # 後続が無ければ短時間だけ待ち、来なければその時点のバッチで推論
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(request_queue.get(timeout=min(remaining, self.idle_timeout)))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self, request_queue: queue.Queue) -> None:
+        """
+        推論スレッドのメインループ
+
+        Args:
+            request_queue (queue.Queue): リクエストキュー
+        """
+        # インタープリター等のスレッド毎の資源は実際に推論するこのスレッドで確保する
+        if self.warmup_fn is not None:
+            try:
+                self.warmup_fn()
+            except Exception as e:
+                logger.warning("⚠️ 推論スレッドのウォームアップに失敗: %s", e)
+
+        while True:
+            batch = self._collect(request_queue)
+
+            try:
+                images = np.concatenate([request.image_array for request in batch])
+                results = self.predict_batch_fn(images)
+                for request, result in zip(batch, results):
+                    request.result = result
+
+            except Exception as e:
+                for request in batch:
+                    request.error = e
+
+            finally:
+                self.batch_count += 1
+                self.request_count += len(batch)
+                for request in batch:
+                    request.event.set()
+
+    def get_stats(self) -> dict:
+        """
+        集約統計を取得
+
+        Returns:
+            dict: 集約統計
+        """
+        return {
+            'batch_count': self.batch_count,
+            'request_count': self.request_count,
+            'average_batch_size': round(self.request_count / max(self.batch_count, 1), 2),
+            'max_batch_size': self.max_batch_size
+        }
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+牛肉マーブリング判定システム PWA版
+TensorRT推論エンジンモジュール（GPU環境用）
+
+概要:
+- Kerasモデルを ONNX 経由で TensorRT エンジン (FP16) に変換
+- 変換済みエンジン (.plan) の読み込みと推論実行
+- GPU・TensorRT が無い環境では使用しない（呼び出し側でフォールバック）
+
+主な機能:
+- Keras → ONNX 変換 (tf2onnx)
+- ONNX → TensorRT エンジン構築（FP16）
+- CUDAストリームを用いた推論実行（複数の実行コンテキストで転送と演算を重ね合わせ）
+"""
+
+import re
+import ctypes
+import queue
+from pathlib import Path
+from typing import Tuple, Union
+
+import numpy as np
+
+
+def _check_cuda(result):
+    """
+    CUDAランタイムAPIの戻り値を検証
+
+    Args:
+        result (tuple): (エラーコード, 戻り値...) 形式の戻り値
+
+    Returns:
+        Any: エラーコードを除いた戻り値
+
+    Raises:
+        RuntimeError: CUDAエラーの場合
+    """
+    from cuda import cudart
+
+    error, *values = result
+    if error != cudart.cudaError_t.cudaSuccess:
+        raise RuntimeError(f"CUDAエラー: {error}")
+    if not values:
+        return None
+    return values[0] if len(values) == 1 else values
+
+
+def engine_cache_name(device: int = 0) -> str:
+    """
+    TensorRTエンジンのキャッシュファイル名を取得
+
+    シリアライズしたエンジンは構築時と同じGPU・TensorRTバージョンでのみ読み込めるため、
+    両者をファイル名に含め、GPUやTensorRTを変更した場合は別のエンジンを構築する
+
+    Args:
+        device (int): CUDAデバイス番号
+
+    Returns:
+        str: ファイル名（例: 'engine-NVIDIA_A10G-trt8.6.1.plan'）
+
+    Raises:
+        ImportError: TensorRT・cuda-python が無い場合
+        RuntimeError: GPU情報を取得できない場合
+    """
+    import tensorrt as trt
+    from cuda import cudart
+
+    properties = _check_cuda(cudart.cudaGetDeviceProperties(device))
+    device_name = properties.name.decode('utf-8', 'ignore').rstrip('\x00')
+    device_name = re.sub(r'[^0-9A-Za-z.]+', '_', device_name).strip('_')
+    return f"engine-{device_name}-trt{trt.__version__}.plan"
+
+
+def export_onnx(model, input_shape: Tuple[int, ...], onnx_path: Union[str, Path],
+                opset: int = 17) -> Path:
+    """
+    KerasモデルをONNX形式で出力
+
+    Args:
+        model (tf.keras.Model): 変換対象のKerasモデル
+        input_shape (Tuple[int, ...]): 入力形状 (1, height, width, 3)
+        onnx_path (Union[str, Path]): 出力先
+        opset (int): ONNX opset バージョン
+
+    Returns:
+        Path: 出力したONNXファイルのパス
+    """
+    import tensorflow as tf
+    import tf2onnx
+
+    onnx_path = Path(onnx_path)
+    spec = tf.TensorSpec(input_shape, tf.float32, name='input')
+    tf2onnx.convert.from_keras(
+        model, input_signature=[spec], opset=opset, output_path=str(onnx_path))
+    return onnx_path
+
+
+def build_engine(onnx_path: Union[str, Path], engine_path: Union[str, Path],
+                 fp16: bool = True, workspace_mb: int = 1024) -> Path:
+    """
+    ONNXモデルからTensorRTエンジンを構築して保存
+
+    Args:
+        onnx_path (Union[str, Path]): ONNXファイルのパス
+        engine_path (Union[str, Path]): 出力先 (.plan)
+        fp16 (bool): FP16演算を有効にするか（GPUが対応している場合のみ）
+        workspace_mb (int): ビルド時のワークスペース上限（MB）
+
+    Returns:
+        Path: 出力したエンジンファイルのパス
+
+    Raises:
+        RuntimeError: ONNXの解析またはエンジン構築に失敗した場合
+    """
+    import tensorrt as trt
+
+    logger = trt.Logger(trt.Logger.WARNING)
+    builder = trt.Builder(logger)
+    network = builder.create_network(
+        1 << int(trt.NetworkDefinitionCreationFlag.EXPLICIT_BATCH))
+    parser = trt.OnnxParser(network, logger)
+
+    if not parser.parse(Path(onnx_path).read_bytes()):
+        errors = [str(parser.get_error(i)) for i in range(parser.num_errors)]
+        raise RuntimeError(f"ONNX解析エラー: {'; '.join(errors)}")
+
+    config = builder.create_builder_config()
+    config.set_memory_pool_limit(trt.MemoryPoolType.WORKSPACE, workspace_mb << 20)
+    if fp16 and builder.platform_has_fast_fp16:
+        config.set_flag(trt.BuilderFlag.FP16)
+
+    serialized = builder.build_serialized_network(network, config)
+    if serialized is None:
+        raise RuntimeError("TensorRTエンジンの構築に失敗しました")
+
+    engine_path = Path(engine_path)
+    engine_path.write_bytes(bytes(serialized))
+    return engine_path
+
+
+class _ExecutionSlot:
+    """
+    実行コンテキスト・CUDAストリーム・入出力バッファの組
+    """
+
+    __slots__ = ('context', 'stream', 'host_buffers', 'device_buffers')
+
+    def __init__(self, context, stream):
+        self.context = context
+        self.stream = stream
+        self.host_buffers = {}
+        self.device_buffers = {}
+
+
+class TensorRTEngine:
+    """
+    TensorRT推論エンジンクラス
+
+    固定形状 (1, height, width, 3) の入力に対してFP16エンジンで推論する
+    実行コンテキストを複数持ち、同時に呼び出された推論は別ストリームで実行されるため、
+    一方の転送中に他方の演算が進む（ダブルバッファリング）
+    """
+
+    def __init__(self, engine_path: Union[str, Path], num_streams: int = 2):
+        """
+        エンジンの読み込みと入出力バッファの確保
+
+        Args:
+            engine_path (Union[str, Path]): TensorRTエンジン (.plan) のパス
+            num_streams (int): 同時に実行できる推論数（実行コンテキスト・ストリーム数）
+
+        Raises:
+            RuntimeError: エンジンの読み込みに失敗した場合
+        """
+        import tensorrt as trt
+
+        self.engine_path = Path(engine_path)
+        self._logger = trt.Logger(trt.Logger.WARNING)
+        self._runtime = trt.Runtime(self._logger)
+        self._engine = self._runtime.deserialize_cuda_engine(self.engine_path.read_bytes())
+        if self._engine is None:
+            raise RuntimeError(f"TensorRTエンジンを読み込めません: {self.engine_path}")
+
+        self.input_name = None
+        self.output_name = None
+        for i in range(self._engine.num_io_tensors):
+            name = self._engine.get_tensor_name(i)
+            if self._engine.get_tensor_mode(name) == trt.TensorIOMode.INPUT:
+                self.input_name = name
+            else:
+                self.output_name = name
+
+        # 空いている実行スロット（推論中のスロットはキューから取り出されている）
+        self._slots = []
+        self._free_slots = queue.SimpleQueue()
+        for _ in range(max(1, num_streams)):
+            slot = self._create_slot()
+            self._slots.append(slot)
+            self._free_slots.put(slot)
+
+        self.input_shape = self._slots[0].host_buffers[self.input_name].shape
+
+    def _create_slot(self) -> _ExecutionSlot:
+        """
+        実行コンテキストとストリーム、入出力バッファを確保
+
+        Returns:
+            _ExecutionSlot: 確保した実行スロット
+        """
+        import tensorrt as trt
+        from cuda import cudart
+
+        context = self._engine.create_execution_context()
+        slot = _ExecutionSlot(context, _check_cuda(cudart.cudaStreamCreate()))
+
+        for name in (self.input_name, self.output_name):
+            shape = tuple(context.get_tensor_shape(name))
+            dtype = np.dtype(trt.nptype(self._engine.get_tensor_dtype(name)))
+
+            # ページロックメモリは非同期転送を可能にするためホスト側に使用
+            nbytes = int(np.prod(shape)) * dtype.itemsize
+            host_ptr = _check_cuda(cudart.cudaMallocHost(nbytes))
+            host = np.frombuffer(
+                (ctypes.c_byte * nbytes).from_address(host_ptr), dtype=dtype).reshape(shape)
+            device = _check_cuda(cudart.cudaMalloc(nbytes))
+            context.set_tensor_address(name, device)
+
+            slot.host_buffers[name] = host
+            slot.device_buffers[name] = device
+
+        return slot
+
+    def infer(self, image_array: np.ndarray) -> np.ndarray:
+        """
+        推論を実行（空いている実行スロットが無い場合は待機）
+
+        Args:
+            image_array (np.ndarray): 入力画像 (1, height, width, 3)、float32
+
+        Returns:
+            np.ndarray: モデル出力
+        """
+        from cuda import cudart
+
+        to_device = cudart.cudaMemcpyKind.cudaMemcpyHostToDevice
+        to_host = cudart.cudaMemcpyKind.cudaMemcpyDeviceToHost
+
+        slot = self._free_slots.get()
+        try:
+            host_in = slot.host_buffers[self.input_name]
+            host_out = slot.host_buffers[self.output_name]
+
+            np.copyto(host_in, image_array, casting='unsafe')
+            _check_cuda(cudart.cudaMemcpyAsync(
+                slot.device_buffers[self.input_name], host_in.ctypes.data,
+                host_in.nbytes, to_device, slot.stream))
+            slot.context.execute_async_v3(slot.stream)
+            _check_cuda(cudart.cudaMemcpyAsync(
+                host_out.ctypes.data, slot.device_buffers[self.output_name],
+                host_out.nbytes, to_host, slot.stream))
+            _check_cuda(cudart.cudaStreamSynchronize(slot.stream))
+            return host_out.copy()
+        finally:
+            self._free_slots.put(slot)
+
+    def __del__(self):
+        """
+        GPUリソースの解放
+        """
+        try:
+            from cuda import cudart
+
+            for slot in self._slots:
+                for device in slot.device_buffers.values():
+                    cudart.cudaFree(device)
+                for host in slot.host_buffers.values():
+                    cudart.cudaFreeHost(host.ctypes.data)
+                cudart.cudaStreamDestroy(slot.stream)
+        except Exception:
+            pass